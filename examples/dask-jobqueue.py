@@ -92,9 +92,9 @@ def target_function(trial: Trial, _pipeline: Node) -> Trial.Report:
     trial.store({"config.json": trial.config})
     with trial.profile("data-loading"):
         X_train, X_val, X_test, y_train, y_val, y_test = (
-            trial.bucket["X_train.csv"].load(),
-            trial.bucket["X_val.csv"].load(),
-            trial.bucket["X_test.csv"].load(),
+            trial.bucket["X_train.parquet"].load(),
+            trial.bucket["X_val.parquet"].load(),
+            trial.bucket["X_test.parquet"].load(),
             trial.bucket["y_train.npy"].load(),
             trial.bucket["y_val.npy"].load(),
             trial.bucket["y_test.npy"].load(),
@@ -149,9 +149,9 @@ X_test, y_test = data["test"]
 bucket = PathBucket("example-hpo", clean=True, create=True)
 bucket.store(
     {
-        "X_train.csv": X_train,
-        "X_val.csv": X_val,
-        "X_test.csv": X_test,
+        "X_train.parquet": X_train,
+        "X_val.parquet": X_val,
+        "X_test.parquet": X_test,
         "y_train.npy": y_train,
         "y_val.npy": y_val,
         "y_test.npy": y_test,
@@ -104,13 +104,32 @@ file system, where we have our dataset stored.
 
 We also pass in our pipeline, which we will use to build our sklearn pipeline with a
 specific `trial.config` suggested by the [`Optimizer`][amltk.optimization.Optimizer].
+
+As every trial evaluated by a worker uses the same data, we load it only once per
+worker process and keep it in memory for the trials that follow.
 """
+from functools import lru_cache
+from pathlib import Path
+
 from sklearn.metrics import accuracy_score
 
 from amltk.optimization import Trial
 from amltk.store import PathBucket
 
 
+@lru_cache(maxsize=1)
+def load_data(path: Path) -> tuple[Any, ...]:
+    data_bucket = PathBucket(path)
+    return (
+        data_bucket["X_train.parquet"].load(),
+        data_bucket["X_val.parquet"].load(),
+        data_bucket["X_test.parquet"].load(),
+        data_bucket["y_train.npy"].load(),
+        data_bucket["y_val.npy"].load(),
+        data_bucket["y_test.npy"].load(),
+    )
+
+
 def target_function(
     trial: Trial,
     _pipeline: Node,
@@ -119,14 +138,7 @@ def target_function(
     trial.store({"config.json": trial.config})
     # Load in data
     with trial.profile("data-loading"):
-        X_train, X_val, X_test, y_train, y_val, y_test = (
-            data_bucket["X_train.csv"].load(),
-            data_bucket["X_val.csv"].load(),
-            data_bucket["X_test.csv"].load(),
-            data_bucket["y_train.npy"].load(),
-            data_bucket["y_val.npy"].load(),
-            data_bucket["y_test.npy"].load(),
-        )
+        X_train, X_val, X_test, y_train, y_val, y_test = load_data(data_bucket.path)
 
     # Configure the pipeline with the trial config before building it.
     sklearn_pipeline = _pipeline.configure(trial.config).build("sklearn")
@@ -197,9 +209,9 @@ bucket = PathBucket("example-hpo", clean=True, create=True)
 data_bucket = bucket / "data"
 data_bucket.store(
     {
-        "X_train.csv": X_train,
-        "X_val.csv": X_val,
-        "X_test.csv": X_test,
+        "X_train.parquet": X_train,
+        "X_val.parquet": X_val,
+        "X_test.parquet": X_test,
         "y_train.npy": y_train,
         "y_val.npy": y_val,
         "y_test.npy": y_test,
@@ -224,7 +236,8 @@ parser out the space of hyperparameters to optimize.
 from amltk.optimization import Metric
 from amltk.scheduling import Scheduler
 
-scheduler = Scheduler.with_processes(2)
+N_WORKERS = 2
+scheduler = Scheduler.with_processes(N_WORKERS)
 
 from amltk.optimization.optimizers.smac import SMACOptimizer
 
@@ -256,11 +269,12 @@ control the flow of how things run.
 Check out the [task guide](../guides/scheduling.md) for more.
 
 This one here asks the optimizer for a new trial when the scheduler starts and
-launches the task we created earlier with this trial.
+launches the task we created earlier with this trial. We use `repeat=N_WORKERS`
+so that every worker of the scheduler gets a trial to evaluate from the start.
 """
 
 
-@scheduler.on_start
+@scheduler.on_start(repeat=N_WORKERS)
 def launch_initial_tasks() -> None:
     """When we start, launch `n_workers` tasks."""
     trial = optimizer.ask()
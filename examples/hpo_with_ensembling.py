@@ -140,7 +140,7 @@ pipeline = (
         },
         name="feature_preprocessing",
         config={
-            "categories": make_column_selector(dtype_include=object),
+            "categories": make_column_selector(dtype_exclude=np.number),
             "numbers": make_column_selector(dtype_include=np.number),
         },
     )
@@ -205,9 +205,9 @@ def target_function(
     pipeline: Sequential,
 ) -> Trial.Report:
     X_train, X_val, X_test, y_train, y_val, y_test = (  # (1)!
-        bucket["X_train.csv"].load(),
-        bucket["X_val.csv"].load(),
-        bucket["X_test.csv"].load(),
+        bucket["X_train.parquet"].load(),
+        bucket["X_val.parquet"].load(),
+        bucket["X_test.parquet"].load(),
         bucket["y_train.npy"].load(),
         bucket["y_val.npy"].load(),
         bucket["y_test.npy"].load(),
@@ -340,9 +340,9 @@ if path.exists():
 bucket = PathBucket(path)
 bucket.store(  # (2)!
     {
-        "X_train.csv": X_train,
-        "X_val.csv": X_val,
-        "X_test.csv": X_test,
+        "X_train.parquet": X_train,
+        "X_val.parquet": X_val,
+        "X_test.parquet": X_test,
         "y_train.npy": y_train,
         "y_val.npy": y_val,
         "y_test.npy": y_test,
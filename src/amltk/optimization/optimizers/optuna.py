@@ -145,6 +145,18 @@ if TYPE_CHECKING:
             ...
 
 
+def _directions_for(
+    metrics: Metric | Sequence[Metric],
+) -> tuple[list[Metric], list[StudyDirection]]:
+    """Normalize the metrics to a list and get the study direction for each."""
+    _metrics = [metrics] if isinstance(metrics, Metric) else list(metrics)
+    directions = [
+        StudyDirection.MINIMIZE if m.minimize else StudyDirection.MAXIMIZE
+        for m in _metrics
+    ]
+    return _metrics, directions
+
+
 class OptunaOptimizer(Optimizer[OptunaTrial]):
     """An optimizer that uses Optuna to optimize a search space."""
 
@@ -168,31 +180,23 @@ class OptunaOptimizer(Optimizer[OptunaTrial]):
             seed: The seed to use for the sampler and trials.
         """
         # Verify the study has the same directions as the metrics
-        match metrics:
-            case Metric(minimize=minimize):
-                _dir = StudyDirection.MINIMIZE if minimize else StudyDirection.MAXIMIZE
-                if study.direction != _dir:
-                    raise ValueError(
-                        f"The study direction is {_dir}, but the metric minimize is "
-                        f"{minimize}.",
-                    )
-            case metrics:
-                _dirs = [
-                    StudyDirection.MINIMIZE if m.minimize else StudyDirection.MAXIMIZE
-                    for m in metrics
-                ]
-                if study.directions != _dirs:
-                    raise ValueError(
-                        f"The study directions are {_dirs}, but the metrics minimize "
-                        f"are {[m.minimize for m in metrics]}.",
-                    )
+        metrics, directions = _directions_for(metrics)
+        if study.directions != directions:
+            raise ValueError(
+                f"The study directions are {study.directions}, but the metrics"
+                f" require {directions} given their minimize of"
+                f" {[m.minimize for m in metrics]}.",
+            )
 
-        metrics = [metrics] if isinstance(metrics, Metric) else metrics
         super().__init__(bucket=bucket, metrics=metrics)
         self.seed = amltk.randomness.as_int(seed)
         self.study = study
         self.space = space
 
+        # The worst value of each metric, in the order of the study directions,
+        # used in place of any metric missing from a report in `tell()`.
+        self._worsts = dict(self.metrics.worsts())
+
     @override
     @classmethod
     def create(
@@ -252,19 +256,10 @@ class OptunaOptimizer(Optimizer[OptunaTrial]):
                 case metrics:
                     sampler = NSGAIISampler(seed=sampler_seed)  # from `create_study()`
 
-        match metrics:
-            case Metric(minimize=minimize):
-                direction = [
-                    StudyDirection.MINIMIZE if minimize else StudyDirection.MAXIMIZE,
-                ]
-            case metrics:
-                direction = [
-                    StudyDirection.MINIMIZE if m.minimize else StudyDirection.MAXIMIZE
-                    for m in metrics
-                ]
+        _, directions = _directions_for(metrics)
 
         return cls(
-            study=optuna.create_study(directions=direction, sampler=sampler, **kwargs),
+            study=optuna.create_study(directions=directions, sampler=sampler, **kwargs),
             metrics=metrics,
             space=space,
             bucket=bucket,
@@ -286,24 +281,38 @@ class OptunaOptimizer(Optimizer[OptunaTrial]):
     ) -> Trial[OptunaTrial] | Iterable[Trial[OptunaTrial]]:
         """Ask the optimizer for a new config.
 
+        Args:
+            n: The number of configs to ask for. If `None`, ask for a single config.
+
         Returns:
             The trial info for the new config.
         """
-        if n is not None:
-            return (self.ask(n=None) for _ in range(n))
-
-        optuna_trial: optuna.Trial = self.study.ask(self.space)
-        config = optuna_trial.params
-        trial_number = optuna_trial.number
-        unique_name = f"{trial_number=}"
-        return Trial.create(
-            name=unique_name,
-            seed=self.seed,
-            config=config,
-            info=optuna_trial,
-            bucket=self.bucket / unique_name,
-            metrics=self.metrics,
-        )
+        # Bind everything that stays the same across the batch just once
+        study = self.study
+        space = self.space
+        seed = self.seed
+        bucket = self.bucket
+        metrics = self.metrics
+
+        trials: list[Trial[OptunaTrial]] = []
+        for _ in range(1 if n is None else n):
+            optuna_trial: optuna.Trial = study.ask(space)
+            trial_number = optuna_trial.number
+            unique_name = f"{trial_number=}"
+            trial: Trial[OptunaTrial] = Trial.create(
+                name=unique_name,
+                seed=seed,
+                config=optuna_trial.params,
+                info=optuna_trial,
+                bucket=bucket / unique_name,
+                metrics=metrics,
+            )
+            trials.append(trial)
+
+        if n is None:
+            return trials[0]
+
+        return trials
 
     @override
     def tell(self, report: Trial.Report[OptunaTrial]) -> None:
@@ -319,16 +328,17 @@ class OptunaOptimizer(Optimizer[OptunaTrial]):
             case Trial.Status.CRASHED | Trial.Status.UNKNOWN | Trial.Status.FAIL:
                 # NOTE: Can't tell any values if the trial crashed or failed
                 self.study.tell(trial=trial, state=TrialState.FAIL)
+            case Trial.Status.SUCCESS if len(self._worsts) == 1:
+                # Single objective, look up the one value directly
+                [(name, worst)] = self._worsts.items()
+                value = report.values.get(name, worst)
+                self.study.tell(trial=trial, state=TrialState.COMPLETE, values=value)
             case Trial.Status.SUCCESS:
-                values = {
-                    name: report.values.get(name, metric.worst)
-                    for name, metric in self.metrics.items()
-                }
-                v: list[float] = list(values.values())
-                if len(v) == 1:
-                    self.study.tell(trial=trial, state=TrialState.COMPLETE, values=v[0])
-                else:
-                    self.study.tell(trial=trial, state=TrialState.COMPLETE, values=v)
+                v: list[float] = [
+                    report.values.get(name, worst)
+                    for name, worst in self._worsts.items()
+                ]
+                self.study.tell(trial=trial, state=TrialState.COMPLETE, values=v)
 
     @override
     @classmethod
@@ -4,13 +4,11 @@ that can be used can be assembled into a pipeline.
 from __future__ import annotations
 
 import inspect
-from collections.abc import Callable, Iterator, Mapping, Sequence
+from collections.abc import Callable, Iterator, Mapping
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, ClassVar, TypeVar, overload
 from typing_extensions import Self, override
 
-from more_itertools import first_true
-
 from amltk._functional import entity_name, mapping_select
 from amltk.exceptions import (
     ComponentBuildError,
@@ -66,8 +64,9 @@ def as_node(  # noqa: PLR0911
     thing: Node | NodeLike[Item],
     name: str | None = None,
 ) -> Node | Choice | Join | Sequential | Fixed[Item]:
-    """Convert a node, pipeline, set or tuple into a component, copying anything
-    in the process and removing all linking to other nodes.
+    """Convert a node, pipeline, set or tuple into a component.
+
+    A node that does not need renaming is returned as is.
 
     Args:
         thing: The thing to convert
@@ -84,8 +83,9 @@ def as_node(  # noqa: PLR0911
             return Join(*thing, name=name)
         case list():
             return Sequential(*thing, name=name)
+        case Node() if name is None or name == thing.name:
+            return thing
         case Node():
-            name = thing.name if name is None else name
             return thing.mutate(name=name)
         case type():
             return Component(thing, name=name)
@@ -456,34 +456,20 @@ class Sequential(Node[Item, Space]):
     @override
     def __rshift__(self, other: Node | NodeLike) -> Sequential:
         other_node = as_node(other)
-        if any(other_node.name == node.name for node in self.nodes):
+        if other_node.name in self._nodes_by_name:
             raise ValueError(
                 f"Can't handle node with name '{other_node.name} as"
                 f" there is already a node called '{other_node.name}' in {self.name}",
             )
 
-        nodes = (*tuple(as_node(n) for n in self.nodes), other_node)
+        nodes = (*self.nodes, other_node)
         return self.mutate(name=self.name, nodes=nodes)
 
     @override
-    def walk(
-        self,
-        path: Sequence[Node] | None = None,
-    ) -> Iterator[tuple[list[Node], Node]]:
-        """Walk the nodes in this chain.
-
-        Args:
-            path: The current path to this node
-
-        Yields:
-            The parents of the node and the node itself
-        """
-        path = list(path) if path is not None else []
-        yield path, self
-
+    def _walk_children(self, path: list[Node]) -> Iterator[tuple[list[Node], Node]]:
         path = [*path, self]
         for node in self.nodes:
-            yield from node.walk(path=path)
+            yield path, node
 
             # Append the previous node so that the next node in the sequence is
             # lead to from the previous node
@@ -578,7 +564,7 @@ class Choice(Node[Item, Space]):
     @override
     def __or__(self, other: Node | NodeLike) -> Choice:
         other_node = as_node(other)
-        if any(other_node.name == node.name for node in self.nodes):
+        if other_node.name in self._nodes_by_name:
             raise ValueError(
                 f"Can't handle node with name '{other_node.name} as"
                 f" there is already a node called '{other_node.name}' in {self.name}",
@@ -586,7 +572,7 @@ class Choice(Node[Item, Space]):
 
         nodes = tuple(
             sorted(
-                [as_node(n) for n in self.nodes] + [other_node],
+                [*self.nodes, other_node],
                 key=lambda n: n.name,
             ),
         )
@@ -600,11 +586,7 @@ class Choice(Node[Item, Space]):
         """
         match self.config:
             case {"__choice__": choice}:
-                chosen = first_true(
-                    self.nodes,
-                    pred=lambda node: node.name == choice,
-                    default=None,
-                )
+                chosen = self._nodes_by_name.get(choice)
                 if chosen is None:
                     raise NodeNotFoundError(choice, self.name)
 
@@ -668,11 +650,7 @@ class Choice(Node[Item, Space]):
         if len(self.nodes) > 0:
             choice_made = config.get("__choice__", None)
             if choice_made is not None:
-                matching_child = first_true(
-                    self.nodes,
-                    pred=lambda node: node.name == choice_made,
-                    default=None,
-                )
+                matching_child = self._nodes_by_name.get(choice_made)
                 if matching_child is None:
                     raise ValueError(
                         f"Can not find matching child for choice {self.name} with child"
@@ -707,13 +685,11 @@ class Choice(Node[Item, Space]):
                 )
                 _kwargs["nodes"] = nodes
 
+        child_names = tuple(self._nodes_by_name)
         this_config = {
             hp: v
             for hp, v in config.items()
-            if (
-                ":" not in hp
-                and not any(hp.startswith(f"{node.name}") for node in self.nodes)
-            )
+            if ":" not in hp and not hp.startswith(child_names)
         }
         if self.config is not None:
             this_config = {**self.config, **this_config}
@@ -920,11 +896,11 @@ class Join(Node[Item, Space]):
     @override
     def __and__(self, other: Node | NodeLike) -> Join:
         other_node = as_node(other)
-        if any(other_node.name == node.name for node in self.nodes):
+        if other_node.name in self._nodes_by_name:
             raise ValueError(
                 f"Can't handle node with name '{other_node.name} as"
                 f" there is already a node called '{other_node.name}' in {self.name}",
             )
 
-        nodes = (*tuple(as_node(n) for n in self.nodes), other_node)
+        nodes = (*self.nodes, other_node)
         return self.mutate(name=self.name, nodes=nodes)
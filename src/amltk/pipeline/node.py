@@ -44,7 +44,7 @@ import warnings
 from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
-from functools import partial
+from functools import cached_property, partial
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
@@ -62,8 +62,7 @@ from typing import (
 )
 from typing_extensions import override
 
-from more_itertools import all_unique, first_true
-from sklearn.pipeline import Pipeline as SklearnPipeline
+from more_itertools import first_true
 
 from amltk._functional import classname, funcname, mapping_select, prefix_keys
 from amltk._richutil import RichRenderable
@@ -85,6 +84,7 @@ if TYPE_CHECKING:
     from ConfigSpace import ConfigurationSpace
     from rich.console import RenderableType
     from rich.panel import Panel
+    from sklearn.pipeline import Pipeline as SklearnPipeline
 
     from amltk.optimization.metric import Metric
     from amltk.optimization.trial import Trial
@@ -199,7 +199,7 @@ class RichOptions(NamedTuple):
     node_orientation: Literal["horizontal", "vertical"] = "horizontal"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ParamRequest(Generic[T]):
     """A parameter request for a node. This is most useful for things like seeds."""
 
@@ -304,34 +304,37 @@ class Node(RichRenderable, Generic[Item, Space]):
             meta: Any meta information about this node
         """
         super().__init__()
-        object.__setattr__(self, "name", name)
-        object.__setattr__(self, "item", item)
-        object.__setattr__(self, "config", config)
-        object.__setattr__(self, "space", space)
-        object.__setattr__(self, "fidelities", fidelities)
-        object.__setattr__(self, "config_transform", config_transform)
-        object.__setattr__(self, "meta", meta)
-        object.__setattr__(self, "nodes", nodes)
-
-        if not all_unique(node.name for node in self.nodes):
-            raise DuplicateNamesError(
-                f"Duplicate node names in {self}. " "All nodes must have unique names.",
-            )
+        self.__dict__.update(
+            name=name,
+            item=item,
+            config=config,
+            space=space,
+            fidelities=fidelities,
+            config_transform=config_transform,
+            meta=meta,
+            nodes=nodes,
+        )
+
+        # Validate the names of the children in a single pass over them
+        seen_names: set[str] = set()
+        for child in nodes:
+            if child.name in seen_names:
+                raise DuplicateNamesError(
+                    f"Duplicate node names in {self}. "
+                    "All nodes must have unique names.",
+                )
 
-        for child in self.nodes:
-            if child.name == self.name:
+            if child.name == name:
                 raise DuplicateNamesError(
                     f"Cannot have a child node with the same name as its parent. "
                     f"{self.name=} {child.name=}",
                 )
 
+            seen_names.add(child.name)
+
     def __getitem__(self, key: str) -> Node:
         """Get the first from [`.nodes`][amltk.pipeline.node.Node.nodes] with `key`."""
-        found = first_true(
-            self.nodes,
-            None,
-            lambda node: node.name == key,
-        )
+        found = self._nodes_by_name.get(key)
         if found is None:
             raise KeyError(
                 f"Could not find node with name `{key}` in '{self.name}'."
@@ -340,6 +343,23 @@ class Node(RichRenderable, Generic[Item, Space]):
 
         return found
 
+    # NOTE: Nodes are frozen, so anything derived from a node never changes and
+    # can be computed once and cached on it. These caches are not pickled.
+    @cached_property
+    def _nodes_by_name(self) -> dict[str, Node]:
+        return {node.name: node for node in self.nodes}
+
+    @cached_property
+    def _parsed_spaces(self) -> dict[Any, Any]:
+        # Parsed search spaces, keyed by the parser and its options
+        return {}
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        state.pop("_nodes_by_name", None)
+        state.pop("_parsed_spaces", None)
+        return state
+
     @override
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, self.__class__):
@@ -428,13 +448,11 @@ class Node(RichRenderable, Generic[Item, Space]):
             )
             _kwargs["nodes"] = nodes
 
+        child_names = tuple(self._nodes_by_name)
         this_config = {
             hp: v
             for hp, v in config.items()
-            if (
-                ":" not in hp
-                and not any(hp.startswith(f"{node.name}") for node in self.nodes)
-            )
+            if ":" not in hp and not hp.startswith(child_names)
         }
         if self.config is not None:
             this_config = {**self.config, **this_config}
@@ -447,8 +465,29 @@ class Node(RichRenderable, Generic[Item, Space]):
         if len(this_config) > 0:
             _kwargs["config"] = dict(this_config)
 
+        # Nothing changed at or below this node, no need to rebuild it
+        if self._configure_is_noop(_kwargs):
+            return self
+
         return self.mutate(**_kwargs)
 
+    def _configure_is_noop(self, kwargs: Mapping[str, Any]) -> bool:
+        # Values are compared by identity as configs can hold arbitrary objects
+        # whose `==` may be expensive or not even return a bool.
+        nodes = kwargs.get("nodes", ())
+        if any(new is not old for new, old in zip(nodes, self.nodes, strict=True)):
+            return False
+
+        config = kwargs.get("config")
+        if config is None:
+            return True
+
+        return (
+            self.config is not None
+            and config.keys() == self.config.keys()
+            and all(v is self.config[k] for k, v in config.items())
+        )
+
     def fidelity_space(self) -> dict[str, Any]:
         """Get the fidelities for this node and any connected nodes."""
         fids = {}
@@ -512,20 +551,26 @@ class Node(RichRenderable, Generic[Item, Space]):
         # Yield the current node
         yield self
 
-        # Iterate through the child nodes
-        for node in self.nodes:
-            if skip_unchosen and isinstance(node, Choice):
-                # If the node is a Choice and skipping unchosen nodes is enabled
-                chosen_node = node.chosen()
-                if chosen_node is None:
-                    raise RuntimeError(
-                        f"No Node chosen in Choice node {node.name}. "
-                        f"Did you call configure?",
-                    )
-                yield from chosen_node.iter(skip_unchosen=skip_unchosen)
+        stack: list[Iterator[Node]] = [iter(self.nodes)]
+        while stack:
+            for node in stack[-1]:
+                if skip_unchosen and isinstance(node, Choice):
+                    # If the node is a Choice and skipping unchosen nodes is enabled
+                    chosen_node = node.chosen()
+                    if chosen_node is None:
+                        raise RuntimeError(
+                            f"No Node chosen in Choice node {node.name}. "
+                            f"Did you call configure?",
+                        )
+                    node = chosen_node  # noqa: PLW2901
+
+                yield node
+
+                # Descend into the children of this node before its siblings
+                stack.append(iter(node.nodes))
+                break
             else:
-                # Recursively iterate through the child nodes
-                yield from node.iter(skip_unchosen=skip_unchosen)
+                stack.pop()
 
     def mutate(self, **kwargs: Any) -> Self:
         """Mutate the node with the given keyword arguments.
@@ -583,13 +628,17 @@ class Node(RichRenderable, Generic[Item, Space]):
         Returns:
             The path to the node if found, else None
         """
-        # We found our target, just return now
-
         match key:
+            case str():
+                # Searching by name is the common case, compare names directly
+                # rather than going through a predicate call for every node.
+                for path, node in self.walk():
+                    if node.name == key:
+                        return path
+
+                return None
             case Node():
                 pred = lambda node: node == key
-            case str():
-                pred = lambda node: node.name == key
             case _:
                 pred = key
 
@@ -611,11 +660,26 @@ class Node(RichRenderable, Generic[Item, Space]):
         Yields:
             The parents of the node and the node itself
         """
-        path = list(path) if path is not None else []
-        yield path, self
-
+        # Children are pushed in reverse to keep the depth-first order
+        stack = [(list(path) if path is not None else [], self)]
+        while stack:
+            _path, node = stack.pop()
+
+            # Subclasses may still override `walk()` themselves, defer to them
+            if node is not self and type(node).walk is not Node.walk:
+                yield from node.walk(path=list(_path))
+                continue
+
+            yield list(_path), node
+            stack.extend(reversed(list(node._walk_children(_path))))
+
+    def _walk_children(self, path: list[Node]) -> Iterator[tuple[list[Node], Node]]:
+        """The children of this node with the path to them, used by `walk()`."""
+        # Every child shares the same parent path, build it once rather than
+        # once per child. `walk()` copies it before yielding it.
+        child_path = [*path, self]
         for node in self.nodes:
-            yield from node.walk(path=[*path, self])
+            yield child_path, node
 
     @overload
     def find(self, key: str | Node | Callable[[Node], bool], default: T) -> Node | T:
@@ -642,10 +706,15 @@ class Node(RichRenderable, Generic[Item, Space]):
         """
         itr = self.iter()
         match key:
+            case str():
+                # Same as in `path_to()`, avoid a predicate call per node
+                for node in itr:
+                    if node.name == key:
+                        return node
+
+                return default
             case Node():
                 return first_true(itr, default, lambda node: node == key)
-            case str():
-                return first_true(itr, default, lambda node: node.name == key)
             case _:
                 return first_true(itr, default, key)  # type: ignore
 
@@ -731,7 +800,7 @@ class Node(RichRenderable, Generic[Item, Space]):
         self,
         builder: Literal["sklearn"],
         *builder_args: Any,
-        pipeline_type: type[SklearnPipelineT] = SklearnPipeline,
+        pipeline_type: type[SklearnPipelineT] = ...,
         **builder_kwargs: Any,
     ) -> SklearnPipelineT:
         ...
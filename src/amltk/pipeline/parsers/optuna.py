@@ -199,10 +199,21 @@ def parser(
     if conditionals:
         raise NotImplementedError("Conditionals are not yet supported with Optuna.")
 
+    # The distributions are immutable, a shallow copy is safe to hand out
+    key = ("optuna", flat, delim)
+    cached = node._parsed_spaces.get(key)
+    if cached is None:
+        cached = _parser(node, flat=flat, delim=delim)
+        node._parsed_spaces[key] = cached
+
+    return dict(cached)
+
+
+def _parser(node: Node, *, flat: bool, delim: str) -> OptunaSearchSpace:
     space = prefix_keys(_parse_space(node), prefix=f"{node.name}{delim}")
 
     for child in node.nodes:
-        subspace = parser(child, flat=flat, conditionals=conditionals, delim=delim)
+        subspace = parser(child, flat=flat, delim=delim)
         if not flat:
             subspace = prefix_keys(subspace, prefix=f"{node.name}{delim}")
 
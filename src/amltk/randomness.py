@@ -96,4 +96,6 @@ def randuid(
         A random uid
     """
     rng = as_rng(seed)
-    return "".join(rng.choice(np.asarray(charset), size=k))
+    # Matches `rng.choice(np.asarray(charset), size=k)` for the same seed
+    indices = rng.integers(0, len(charset), size=k)
+    return "".join([charset[i] for i in indices])
@@ -241,20 +241,19 @@ from __future__ import annotations
 
 import logging
 import math
+import os
 import time
 from collections import Counter, defaultdict
 from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
 from functools import partial
+from itertools import count
 from typing import TYPE_CHECKING, Any, Generic, TypeAlias, TypeVar, overload
 from typing_extensions import ParamSpec, override
 
-from more_itertools import first_true
-
 from amltk._functional import funcname
 from amltk._richutil.renderers.function import Function
 from amltk.exceptions import EventNotKnownError
-from amltk.randomness import randuid
 
 if TYPE_CHECKING:
     from rich.console import RenderableType
@@ -266,6 +265,9 @@ R = TypeVar("R")
 
 logger = logging.getLogger(__name__)
 
+# Unique among the emitters of this process, no random id needed
+_emitter_ids = count()
+
 
 @dataclass
 class RegisteredTimeCallOrderStrategy:
@@ -325,7 +327,7 @@ class Event(Generic[P, R]):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Subscriber(Generic[P, R]):
     """An object that can be used to easily subscribe to a certain event.
 
@@ -479,7 +481,7 @@ class Subscriber(Generic[P, R]):
         return self.emitter.emit(self.event, *args, **kwargs)
 
 
-@dataclass
+@dataclass(slots=True)
 class Handler(Generic[P, R]):
     """A handler for an event.
 
@@ -562,7 +564,7 @@ class Emitter:
     name: str | None
     """The name of the emitter."""
 
-    handlers: dict[Event, list[Handler]]
+    handlers: dict[Event, tuple[Handler, ...]]
     """A mapping of events to their handlers."""
 
     event_counts: Counter[Event]
@@ -576,13 +578,17 @@ class Emitter:
                 will be used.
         """
         super().__init__()
-        self.unique_ref = f"{name}-{randuid()}"
+        self.unique_ref = f"{name}-{os.getpid()}-{next(_emitter_ids)}"
         self.emitted_events: set[Event] = set()
 
         self.name = name
-        self.handlers = defaultdict(list)
+        # Tuples, replaced on registration, so emitting needs no defensive copy
+        self.handlers = defaultdict(tuple)
         self.event_counts = Counter()
 
+        # An index of the events by their name, for `as_event()`
+        self._events_by_name: dict[str, Event] = {}
+
     def emit(
         self,
         event: Event[P, R],
@@ -608,6 +614,27 @@ class Emitter:
         self.event_counts[event] += 1
         return [(handler, handler(*args, **kwargs)) for handler in self.handlers[event]]
 
+    def emit_many(self, *emissions: tuple[Event, tuple[Any, ...]]) -> None:
+        """Emit several events one after the other, in one pass.
+
+        This is the same as calling [`emit()`][amltk.scheduling.events.Emitter.emit]
+        for each `(event, args)` in turn, i.e. all handlers of an event are called
+        before those of the next one, except that the responses of the handlers
+        are not collected.
+
+        Args:
+            *emissions: The events to emit, each with the positional arguments
+                to pass to its handlers.
+        """
+        debug = logger.isEnabledFor(logging.DEBUG)
+        for event, args in emissions:
+            if debug:
+                logger.debug(f"{self.name}: Emitting {event}")
+
+            self.event_counts[event] += 1
+            for handler in self.handlers[event]:
+                handler(*args)
+
     @property
     def events(self) -> list[Event]:
         """Return a list of the events."""
@@ -620,7 +647,7 @@ class Emitter:
             event: The event to register the callback for.
         """
         if event not in self.handlers:
-            self.handlers[event] = []
+            self.handlers[event] = ()
 
         return Subscriber(self, event)
 
@@ -718,16 +745,18 @@ class Emitter:
         # Make sure it shows up in the event counts, setting it to 0 if it
         # doesn't exist
         self.event_counts.setdefault(event, 0)
-        self.handlers[event].append(
-            Handler(
-                callback,
-                when=when,
-                every=every,
-                repeat=repeat,
-                max_calls=max_calls,
-                hidden=hidden,
-            ),
+        handler = Handler(
+            callback,
+            when=when,
+            every=every,
+            repeat=repeat,
+            max_calls=max_calls,
+            hidden=hidden,
         )
+        self.handlers[event] = (*self.handlers[event], handler)
+
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
 
         _name = funcname(callback)
         msg = f"{self.name}: Registered callback '{_name}' for event {event}"
@@ -749,7 +778,7 @@ class Emitter:
         """
         for e in event:
             if e not in self.handlers:
-                self.handlers[e] = []
+                self.handlers[e] = ()
 
     def __rich__(self) -> RenderableType:
         from rich.tree import Tree
@@ -789,7 +818,14 @@ class Emitter:
             case Event():
                 return key
             case str():
-                match = first_true(self.events, None, lambda e: e.name == key)
+                match = self._events_by_name.get(key)
+                if match is None:
+                    # The index may be out of date, update it and look again
+                    for e in self.handlers:
+                        self._events_by_name.setdefault(e.name, e)
+
+                    match = self._events_by_name.get(key)
+
                 if match is None:
                     raise EventNotKnownError(
                         f"{key=} is not a valid event for {self.name}."
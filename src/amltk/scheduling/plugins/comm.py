@@ -110,6 +110,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import sys
 from collections.abc import Callable, Iterator
 from contextlib import contextmanager
 from dataclasses import dataclass, field
@@ -175,6 +176,11 @@ class AsyncComm:
         """
         connection = AsyncConnection(self.comm.connection)
         try:
+            # Avoids the extra task `asyncio.wait_for()` creates per message
+            if sys.version_info >= (3, 11):
+                async with asyncio.timeout(timeout):
+                    return await connection.recv()
+
             return await asyncio.wait_for(connection.recv(), timeout=timeout)
         except asyncio.TimeoutError as e:
             raise Comm.TimeoutError(
@@ -1000,6 +1000,7 @@ class Scheduler(RichRenderable):
         *,
         plugins: Comm.Plugin | Iterable[Comm.Plugin | Plugin] = ...,
         init_plugins: bool = ...,
+        batched_emit: bool = ...,
     ) -> Task[P, R]:
         ...
 
@@ -1010,6 +1011,7 @@ class Scheduler(RichRenderable):
         *,
         plugins: Plugin | Iterable[Plugin] = (),
         init_plugins: bool = True,
+        batched_emit: bool = False,
     ) -> Task[P, R]:
         ...
 
@@ -1019,6 +1021,7 @@ class Scheduler(RichRenderable):
         *,
         plugins: Plugin | Iterable[Plugin] = (),
         init_plugins: bool = True,
+        batched_emit: bool = False,
     ) -> Task[P, R]:
         """Create a new task.
 
@@ -1026,6 +1029,9 @@ class Scheduler(RichRenderable):
             function: The function to run using the scheduler.
             plugins: The plugins to attach to the task.
             init_plugins: Whether to initialize the plugins.
+            batched_emit: Whether to emit the events of futures that complete in
+                quick succession together, see
+                [`Task`][amltk.scheduling.task.Task].
 
         Returns:
             A new task.
@@ -1034,7 +1040,13 @@ class Scheduler(RichRenderable):
         # checking to enforce that
         # A. `function` is a callable with the first arg being a Comm
         # B. `plugins`
-        task = Task(function, self, plugins=plugins, init_plugins=init_plugins)  # type: ignore
+        task = Task(
+            function,  # type: ignore
+            self,
+            plugins=plugins,  # type: ignore
+            init_plugins=init_plugins,
+            batched_emit=batched_emit,
+        )
         self.add_renderable(task)
         return task  # type: ignore
 
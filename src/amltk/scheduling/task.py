@@ -72,21 +72,26 @@ to modify tasks, add functionality and add new events.
 """
 from __future__ import annotations
 
+import asyncio
 import logging
 from asyncio import Future
 from collections.abc import Callable, Iterable
-from typing import TYPE_CHECKING, Any, Concatenate, Generic, TypeVar
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
 from typing_extensions import ParamSpec, Self, override
 
 from amltk._functional import callstring, funcname
 from amltk._richutil.renderable import RichRenderable
 from amltk.exceptions import SchedulerNotRunningError
-from amltk.scheduling.events import Emitter, Event, Subscriber
+from amltk.scheduling.events import Emitter, Event
 from amltk.scheduling.plugins.plugin import Plugin
 
 if TYPE_CHECKING:
+    from typing import Concatenate
+
     from rich.panel import Panel
 
+    from amltk.scheduling.events import Subscriber
     from amltk.scheduling.scheduler import Scheduler
 
 logger = logging.getLogger(__name__)
@@ -113,57 +118,13 @@ class Task(Emitter, RichRenderable, Generic[P, R]):
     """The scheduler that this task is registered with."""
     init_plugins: bool
     """Whether to initialize the plugins or not."""
-    queue: list[Future[R]]
-    """The queue of futures for this task."""
+    queue: dict[Future[R], None]
+    """The queue of futures for this task, kept in order of submission."""
     emitter: Emitter
     """The emitter for events of this task."""
-
-    on_submitted: Subscriber[Concatenate[Future[R], P], Any]
-    """An event that is emitted when a future is submitted to the
-    scheduler. It will pass the future as the first argument with args and
-    kwargs following.
-
-    This is done before any callbacks are attached to the future.
-    ```python
-    @task.on_submitted
-    def on_submitted(future: Future[R], *args, **kwargs):
-        print(f"Future {future} was submitted with {args=} and {kwargs=}")
-    ```
-    """
-    on_done: Subscriber[[Future[R]], Any]
-    """Called when a task is done running with a result or exception.
-    ```python
-    @task.on_done
-    def on_done(future: Future[R]):
-        print(f"Future {future} is done")
-    ```
-    """
-    on_cancelled: Subscriber[[Future[R]], Any]
-    """Called when a task is cancelled.
-    ```python
-    @task.on_cancelled
-    def on_cancelled(future: Future[R]):
-        print(f"Future {future} was cancelled")
-    ```
-    """
-    on_result: Subscriber[[Future[R], R], Any]
-    """Called when a task has successfully returned a value.
-    Comes with Future
-    ```python
-    @task.on_result
-    def on_result(future: Future[R], result: R):
-        print(f"Future {future} returned {result}")
-    ```
-    """
-    on_exception: Subscriber[[Future[R], BaseException], Any]
-    """Called when a task failed to return anything but an exception.
-    Comes with Future
-    ```python
-    @task.on_exception
-    def on_exception(future: Future[R], error: BaseException):
-        print(f"Future {future} exceptioned {error}")
-    ```
-    """
+    batched_emit: bool
+    """Whether to hold back the events of completed futures and emit them all
+    together in a single later iteration of the event loop."""
 
     SUBMITTED: Event[Concatenate[Future[R], P], Any] = Event("on-submitted")
     DONE: Event[[Future[R]], Any] = Event("on-done")
@@ -179,6 +140,7 @@ class Task(Emitter, RichRenderable, Generic[P, R]):
         *,
         plugins: Plugin | Iterable[Plugin] = (),
         init_plugins: bool = True,
+        batched_emit: bool = False,
     ) -> None:
         """Initialize a task.
 
@@ -187,6 +149,11 @@ class Task(Emitter, RichRenderable, Generic[P, R]):
             scheduler: The scheduler that this task is registered with.
             plugins: The plugins to use for this task.
             init_plugins: Whether to initialize the plugins or not.
+            batched_emit: Whether to hold back the events of futures that complete
+                in quick succession and emit them together in a single later
+                iteration of the event loop. Useful for many short running
+                futures, at the cost of slightly delaying their events. A future
+                is counted as running until its events have been emitted.
         """
         super().__init__(name=f"Task-{funcname(function)}")
         self.plugins: list[Plugin] = (
@@ -195,35 +162,114 @@ class Task(Emitter, RichRenderable, Generic[P, R]):
         self.function: Callable[P, R] = function
         self.scheduler: Scheduler = scheduler
         self.init_plugins: bool = init_plugins
-        self.queue: list[Future[R]] = []
-
-        # Set up subscription methods to events
-        self.on_submitted = self.subscriber(self.SUBMITTED)
-        self.on_done = self.subscriber(self.DONE)
-        self.on_result = self.subscriber(self.RESULT)
-        self.on_exception = self.subscriber(self.EXCEPTION)
-        self.on_cancelled = self.subscriber(self.CANCELLED)
+        self.batched_emit: bool = batched_emit
+        self._pending_emits: list[Future[R]] = []
+
+        # Bound once, rather than on every submitted future
+        self._process_future_callback = self._process_future
+
+        # The part of `repr()` that never changes, `self.plugins` can be modified
+        # directly so they are formatted on every call.
+        self._repr_prefix = f"{self.__class__.__name__}(unique_ref={self.unique_ref}"
+
+        self.queue: dict[Future[R], None] = {}
+
+        # The subscription methods to events are only created once accessed,
+        # but the events are added now so they can be looked up by name.
+        self.add_event(
+            self.SUBMITTED,
+            self.DONE,
+            self.RESULT,
+            self.EXCEPTION,
+            self.CANCELLED,
+        )
 
         if init_plugins:
             for plugin in self.plugins:
                 plugin.attach_task(self)
 
+    @cached_property
+    def on_submitted(self) -> Subscriber[Concatenate[Future[R], P], Any]:
+        """An event that is emitted when a future is submitted to the scheduler.
+
+        It will pass the future as the first argument with args and kwargs following.
+
+        This is done before any callbacks are attached to the future.
+        ```python
+        @task.on_submitted
+        def on_submitted(future: Future[R], *args, **kwargs):
+            print(f"Future {future} was submitted with {args=} and {kwargs=}")
+        ```
+        """
+        return self.subscriber(self.SUBMITTED)
+
+    @cached_property
+    def on_done(self) -> Subscriber[[Future[R]], Any]:
+        """Called when a task is done running with a result or exception.
+
+        ```python
+        @task.on_done
+        def on_done(future: Future[R]):
+            print(f"Future {future} is done")
+        ```
+        """
+        return self.subscriber(self.DONE)
+
+    @cached_property
+    def on_cancelled(self) -> Subscriber[[Future[R]], Any]:
+        """Called when a task is cancelled.
+
+        ```python
+        @task.on_cancelled
+        def on_cancelled(future: Future[R]):
+            print(f"Future {future} was cancelled")
+        ```
+        """
+        return self.subscriber(self.CANCELLED)
+
+    @cached_property
+    def on_result(self) -> Subscriber[[Future[R], R], Any]:
+        """Called when a task has successfully returned a value.
+
+        Comes with Future
+        ```python
+        @task.on_result
+        def on_result(future: Future[R], result: R):
+            print(f"Future {future} returned {result}")
+        ```
+        """
+        return self.subscriber(self.RESULT)
+
+    @cached_property
+    def on_exception(self) -> Subscriber[[Future[R], BaseException], Any]:
+        """Called when a task failed to return anything but an exception.
+
+        Comes with Future
+        ```python
+        @task.on_exception
+        def on_exception(future: Future[R], error: BaseException):
+            print(f"Future {future} exceptioned {error}")
+        ```
+        """
+        return self.subscriber(self.EXCEPTION)
+
     def futures(self) -> list[Future[R]]:
         """Get the futures for this task.
 
         Returns:
             A list of futures for this task.
         """
-        return self.queue
+        return list(self.queue)
 
     @property
     def n_running(self) -> int:
         """Get the number of futures for this task that are currently running."""
-        return sum(1 for f in self.queue if not f.done())
+        # Futures are only removed from the queue once processed
+        return len(self.queue)
 
     def running(self) -> bool:
         """Check if this task has any futures that are currently running."""
-        return self.n_running > 0
+        return bool(self.queue)
 
     def submit(self, *args: P.args, **kwargs: P.kwargs) -> Future[R] | None:
         """Dispatch this task.
@@ -248,10 +294,11 @@ class Task(Emitter, RichRenderable, Generic[P, R]):
         for plugin in self.plugins:
             items = plugin.pre_submit(fn, *args, **kwargs)
             if items is None:
-                logger.debug(
-                    f"Plugin '{plugin.name}' prevented {self} from being submitted"
-                    f" with {callstring(self.function, *args, **kwargs)}",
-                )
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        f"Plugin '{plugin.name}' prevented {self} from being submitted"
+                        f" with {callstring(self.function, *args, **kwargs)}",
+                    )
                 return None
 
             fn, args, kwargs = items  # type: ignore
@@ -265,40 +312,64 @@ class Task(Emitter, RichRenderable, Generic[P, R]):
             logger.exception("Error submitting task", exc_info=e)
             raise e
 
-        self.queue.append(future)
+        self.queue[future] = None
 
         # We have the function wrapped in something will
         # attach tracebacks to errors, so we need to get the
         # original function name.
-        msg = f"Submitted {callstring(self.function, *args, **kwargs)} from {self}."
-        logger.debug(msg)
+        if logger.isEnabledFor(logging.DEBUG):
+            msg = f"Submitted {callstring(self.function, *args, **kwargs)} from {self}."
+            logger.debug(msg)
 
         self.on_submitted.emit(future, *args, **kwargs)
 
         # Process the task once it's completed
-        # NOTE: If the task is done super quickly or in the sequential mode,
-        # this will immediatly call `self._process_future`.
-        future.add_done_callback(self._process_future)
+        # NOTE: The future is an asyncio future, so even if the task is done super
+        # quickly or in the sequential mode, `self._process_future` is only ever
+        # called on a later iteration of the event loop.
+        future.add_done_callback(self._process_future_callback)
         return future
 
     def _process_future(self, future: Future[R]) -> None:
+        if self.batched_emit:
+            # The future stays in the queue until its events are emitted, so the
+            # task still counts as running until its handlers have been called.
+            self._pending_emits.append(future)
+            # Only the first pending future needs to schedule the flush, any
+            # others completing before it runs are emitted along with it.
+            if len(self._pending_emits) == 1:
+                asyncio.get_running_loop().call_soon(self._emit_pending)
+            return
+
+        self._emit_for_future(future)
+
+    def _emit_pending(self) -> None:
+        pending, self._pending_emits = self._pending_emits, []
+        for future in pending:
+            self._emit_for_future(future)
+
+    def _emit_for_future(self, future: Future[R]) -> None:
         try:
-            self.queue.remove(future)
-        except ValueError as e:
+            self.queue.pop(future)
+        except KeyError as e:
             raise ValueError(f"{future=} not found in task queue {self.queue=}") from e
 
         if future.cancelled():
-            self.on_cancelled.emit(future)
+            self.emit(self.CANCELLED, future)
             return
 
-        self.on_done.emit(future)
-
+        # `DONE` handlers are still all called before the others
         exception = future.exception()
         if exception is not None:
-            self.on_exception.emit(future, exception)
+            self.emit_many(
+                (self.DONE, (future,)),
+                (self.EXCEPTION, (future, exception)),
+            )
         else:
-            result = future.result()
-            self.on_result.emit(future, result)
+            self.emit_many(
+                (self.DONE, (future,)),
+                (self.RESULT, (future, future.result())),
+            )
 
     def attach_plugin(self, plugin: Plugin) -> None:
         """Attach a plugin to this task.
@@ -326,9 +397,7 @@ class Task(Emitter, RichRenderable, Generic[P, R]):
 
     @override
     def __repr__(self) -> str:
-        kwargs = {"unique_ref": self.unique_ref, "plugins": self.plugins}
-        kwargs_str = ", ".join(f"{k}={v}" for k, v in kwargs.items())
-        return f"{self.__class__.__name__}({kwargs_str})"
+        return f"{self._repr_prefix}, plugins={self.plugins})"
 
     @override
     def __rich__(self) -> Panel:
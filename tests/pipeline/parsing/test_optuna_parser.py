@@ -1 +1,31 @@
-# TODO: Fill this in
+from __future__ import annotations
+
+import pytest
+
+from amltk.pipeline import Component, Sequential
+
+try:
+    from optuna.distributions import FloatDistribution
+except ImportError:
+    pytest.skip("Optuna not installed", allow_module_level=True)
+
+
+def test_parsing_twice_produces_same_space() -> None:
+    node = Sequential(
+        Component(object, name="a", space={"x": (1.0, 10.0)}),
+        name="seq",
+    )
+
+    space_1 = node.search_space("optuna")
+    space_2 = node.search_space("optuna")
+    assert space_1 == space_2 == {"seq:a:x": FloatDistribution(1.0, 10.0)}
+
+
+def test_modifying_parsed_space_does_not_affect_later_parses() -> None:
+    node = Component(object, name="a", space={"x": (1.0, 10.0)})
+
+    space = node.search_space("optuna")
+    space["a:y"] = FloatDistribution(0.0, 1.0)
+    del space["a:x"]
+
+    assert node.search_space("optuna") == {"a:x": FloatDistribution(1.0, 10.0)}
@@ -5,14 +5,23 @@ from dataclasses import dataclass
 from amltk.pipeline import Choice, Component, Fixed, Join, Sequential, as_node
 
 
-def test_as_node_returns_copy_of_node() -> None:
+def test_as_node_returns_node_as_is() -> None:
     c = Component(int)
 
     out = as_node(c)
     assert c == out
 
-    # Should be a copied object
-    assert id(out) != id(c)
+    # Nodes are frozen, there's no need to copy them
+    assert out is c
+
+
+def test_as_node_with_name_returns_renamed_copy() -> None:
+    c = Component(int, name="a")
+
+    out = as_node(c, name="b")
+    assert out.name == "b"
+    assert c.name == "a"
+    assert out.item is c.item
 
 
 def test_as_node_with_tuple_returns_join() -> None:
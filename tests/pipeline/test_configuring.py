@@ -191,3 +191,22 @@ def test_choice_with_config_transform_does_not_get_activated_if_not_chosen() ->
         config={"__choice__": "b"},
     )
     assert configured_b == expected_b
+
+
+def test_configure_reuses_unchanged_subtrees() -> None:
+    fixed = Sequential(
+        Component(object, name="x", config={"v": 1}),
+        Component(object, name="y"),
+        name="fixed",
+    )
+    searchable = Component(object, name="one", space={"v": [1, 2, 3]})
+    pipeline = Sequential(fixed, searchable, name="pipeline")
+
+    result = pipeline.configure({"pipeline:one:v": 2})
+
+    assert result is not pipeline
+    assert result.nodes[0] is fixed
+    assert result.nodes[1] == searchable.mutate(config={"v": 2})
+
+    # Nothing to configure, we get back the same node
+    assert fixed.configure({}) is fixed
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
+import pickle
+from collections.abc import Iterator, Mapping, Sequence
 from typing import Any
 
 import pytest
@@ -20,7 +21,7 @@ def test_node_rshift() -> None:
     assert isinstance(out, Sequential)
     assert out.nodes == expected_nodes
     for a, b in zip(out.nodes, expected_nodes, strict=True):
-        assert id(a) != id(b)
+        assert a is b
 
 
 def test_node_and() -> None:
@@ -34,7 +35,7 @@ def test_node_and() -> None:
     assert isinstance(out, Join)
     assert out.nodes == expected_nodes
     for a, b in zip(out.nodes, expected_nodes, strict=True):
-        assert id(a) != id(b)
+        assert a is b
 
 
 def test_node_or() -> None:
@@ -48,7 +49,7 @@ def test_node_or() -> None:
     assert isinstance(out, Choice)
     assert set(out.nodes) == set(expected_nodes)
     for a, b in zip(out.nodes, expected_nodes, strict=True):
-        assert id(a) != id(b)
+        assert a is b
 
 
 def test_single_node_configure() -> None:
@@ -174,6 +175,30 @@ def test_walk() -> None:
         assert path == _exp_path
 
 
+def test_walk_honours_subclass_override_of_walk() -> None:
+    class Opaque(Node):
+        def walk(
+            self,
+            path: Sequence[Node] | None = None,
+        ) -> Iterator[tuple[list[Node], Node]]:
+            yield list(path) if path is not None else [], self
+
+    n1 = Node(name="1")
+    opaque = Opaque(Node(name="hidden"), name="opaque")
+    n3 = Node(name="3")
+
+    seq = Sequential(Node(n1, opaque, name="sub"), n3, name="seq")
+    sub = seq["sub"]
+
+    assert list(seq.walk()) == [
+        ([], seq),
+        ([seq], sub),
+        ([seq, sub], n1),
+        ([seq, sub], opaque),
+        ([seq, sub], n3),
+    ]
+
+
 def test_node_fails_if_children_with_duplicate_name() -> None:
     with pytest.raises(DuplicateNamesError):
         Node(Node(name="child1"), Node(name="child1"), name="node")
@@ -182,3 +207,15 @@ def test_node_fails_if_children_with_duplicate_name() -> None:
 def test_node_fails_if_child_has_same_name() -> None:
     with pytest.raises(DuplicateNamesError):
         Node(Node(name="child1"), Node(name="node"), name="node")
+
+
+def test_pickling_does_not_include_cached_lookups() -> None:
+    seq = Node(Node(name="1"), Node(name="2"), name="seq")
+    size_before = len(pickle.dumps(seq))
+
+    assert seq["1"] is seq.nodes[0]
+    assert len(pickle.dumps(seq)) == size_before
+
+    unpickled = pickle.loads(pickle.dumps(seq))  # noqa: S301
+    assert unpickled == seq
+    assert unpickled["2"] == seq.nodes[1]
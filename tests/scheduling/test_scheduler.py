@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 import warnings
@@ -16,6 +17,7 @@ from pytest_cases import case, fixture, parametrize_with_cases
 
 from amltk.exceptions import EventNotKnownError
 from amltk.scheduling import ExitState, Scheduler, SequentialExecutor
+from amltk.scheduling.plugins import Limiter
 from amltk.types import safe_isinstance
 
 if TYPE_CHECKING:
@@ -219,6 +221,59 @@ def test_chained_tasks(scheduler: Scheduler) -> None:
     assert not scheduler.running()
 
 
+def test_batched_emit_emits_all_results(scheduler: Scheduler) -> None:
+    results: list[float] = []
+    n_running: list[int] = []
+    task = scheduler.task(sleep_and_return, batched_emit=True)
+
+    # Group the results by the iteration of the event loop they arrive in
+    batches: list[list[float]] = []
+    batch: list[float] | None = None
+
+    def close_batch() -> None:
+        nonlocal batch
+        batch = None
+
+    @scheduler.on_start(repeat=4)
+    def launch() -> None:
+        task.submit(sleep_time=0.01)
+
+    # Feed the first round of results back into the task once more
+    @task.on_result
+    def resubmit(_: Future, res: float) -> None:
+        nonlocal batch
+        if batch is None:
+            batch = []
+            batches.append(batch)
+            asyncio.get_running_loop().call_soon(close_batch)
+
+        batch.append(res)
+        results.append(res)
+        n_running.append(task.n_running)
+        if len(results) <= 4:
+            task.submit(sleep_time=res)
+
+    end_status = scheduler.run(wait=True)
+
+    assert task.event_counts == Counter(
+        {task.SUBMITTED: 8, task.DONE: 8, task.RESULT: 8},
+    )
+    assert results == [0.01] * 8
+    assert sum(len(b) for b in batches) == 8
+
+    # The sequential executor completes each round of futures all at once, other
+    # executors complete them whenever they're done, batching only some.
+    if isinstance(scheduler.executor, SequentialExecutor):
+        assert [len(b) for b in batches] == [4, 4]
+
+        # Futures in a batch still count as running until their results are emitted
+        assert n_running == [3, 3, 3, 3, 3, 2, 1, 0]
+
+    assert end_status == ExitState(code=ExitState.Code.EXHAUSTED)
+    assert scheduler.empty()
+    assert not task.running()
+
+
 def test_queue_empty_status(scheduler: Scheduler) -> None:
     task = scheduler.task(sleep_and_return)
 
@@ -455,3 +510,16 @@ def test_call_later_cancellable(scheduler: Scheduler) -> None:
 
     end_status = scheduler.run(timeout=1, end_on_empty=False)
     assert end_status.code == ExitState.Code.TIMEOUT
+
+
+def test_task_repr_reflects_changes_to_its_plugins(scheduler: Scheduler) -> None:
+    task = scheduler.task(sleep_and_return)
+    assert repr(task) == f"Task(unique_ref={task.unique_ref}, plugins=[])"
+
+    limiter = Limiter(max_calls=1)
+    task.plugins.append(limiter)
+    assert repr(task) == f"Task(unique_ref={task.unique_ref}, plugins=[{limiter}])"
+
+    other = Limiter(max_calls=2)
+    task.plugins[0] = other
+    assert repr(task) == f"Task(unique_ref={task.unique_ref}, plugins=[{other}])"